@@ -4,165 +4,23 @@ GDPR-Compliant DevSecOps Security Report Generator
 Converts technical security scan results into executive-friendly HTML reports
 """
 
+import functools
+import hashlib
 import json
+import mmap
 import os
-from datetime import datetime
-from jinja2 import Template
-
-class SecurityReportGenerator:
-    def __init__(self):
-        self.report_data = {
-            'scan_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC'),
-            'project_name': 'GDPR-Compliant DevSecOps Pipeline',
-            'compliance_framework': 'UK GDPR + DevSecOps Best Practices',
-            'total_files_scanned': 0,
-            'security_issues': [],
-            'compliance_status': 'COMPLIANT',
-            'risk_level': 'LOW',
-            'recommendations': []
-        }
-
-    def load_semgrep_results(self, filepath):
-        """Parse Semgrep PII detection results"""
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-
-            self.report_data['total_files_scanned'] = len(data.get('paths', {}).get('scanned', []))
-
-            for result in data.get('results', []):
-                issue = {
-                    'type': 'GDPR Compliance Violation',
-                    'severity': result['extra']['severity'],
-                    'message': result['extra']['message'],
-                    'file': result['path'],
-                    'line': result['start']['line'],
-                    'rule_id': result['check_id'],
-                    'business_impact': self._get_business_impact(result['check_id']),
-                    'remediation': self._get_remediation_advice(result['check_id'])
-                }
-                self.report_data['security_issues'].append(issue)
-
-            # Determine overall risk level
-            if len(data.get('results', [])) == 0:
-                self.report_data['risk_level'] = 'LOW'
-                self.report_data['compliance_status'] = 'COMPLIANT'
-            elif any(r['extra']['severity'] == 'ERROR' for r in data.get('results', [])):
-                self.report_data['risk_level'] = 'HIGH'
-                self.report_data['compliance_status'] = 'NON-COMPLIANT'
-            else:
-                self.report_data['risk_level'] = 'MEDIUM'
-                self.report_data['compliance_status'] = 'PARTIALLY COMPLIANT'
-
-        except FileNotFoundError:
-            print(f"Semgrep results file not found: {filepath}")
-        except json.JSONDecodeError:
-            print(f"Invalid JSON in Semgrep results: {filepath}")
-
-    def load_gitleaks_results(self, filepath):
-        """Parse GitLeaks secret detection results"""
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-
-            for finding in data:
-                issue = {
-                    'type': 'Secret/PII Exposure',
-                    'severity': 'HIGH',
-                    'message': f"Potential {finding.get('Description', 'secret')} detected",
-                    'file': finding.get('File', 'Unknown'),
-                    'line': finding.get('StartLine', 0),
-                    'rule_id': finding.get('RuleID', 'secret-detection'),
-                    'business_impact': 'Data breach risk, ICO fine exposure (up to £20M)',
-                    'remediation': 'Remove secret from code, rotate credentials, implement secrets management'
-                }
-                self.report_data['security_issues'].append(issue)
-                self.report_data['risk_level'] = 'CRITICAL'
-                self.report_data['compliance_status'] = 'NON-COMPLIANT'
-
-        except FileNotFoundError:
-            print(f"GitLeaks results file not found: {filepath}")
-        except (json.JSONDecodeError, KeyError):
-            print(f"Error parsing GitLeaks results: {filepath}")
-
-    def load_vulnerability_scan(self, filepath):
-        """Parse vulnerability scan results"""
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-
-            # Parse Grype/Syft vulnerability results
-            for match in data.get('matches', []):
-                severity = match.get('vulnerability', {}).get('severity', 'UNKNOWN')
-                if severity in ['HIGH', 'CRITICAL']:
-                    issue = {
-                        'type': 'Dependency Vulnerability',
-                        'severity': severity,
-                        'message': f"Vulnerable dependency: {match.get('artifact', {}).get('name', 'Unknown')}",
-                        'file': 'package.json',
-                        'line': 0,
-                        'rule_id': match.get('vulnerability', {}).get('id', 'vuln-scan'),
-                        'business_impact': f"Supply chain security risk, potential data exposure",
-                        'remediation': f"Update to version {match.get('vulnerability', {}).get('fix', {}).get('versions', ['latest'])[0] if match.get('vulnerability', {}).get('fix') else 'latest'}"
-                    }
-                    self.report_data['security_issues'].append(issue)
-
-        except FileNotFoundError:
-            print(f"Vulnerability scan results not found: {filepath}")
-        except (json.JSONDecodeError, KeyError):
-            print(f"Error parsing vulnerability results: {filepath}")
-
-    def _get_business_impact(self, rule_id):
-        """Map technical violations to business impact"""
-        impact_map = {
-            'hardcoded-personal-data': 'GDPR Article 5 violation - ICO fine risk up to £20M, reputational damage',
-            'detect-pii-in-logs': 'Data exposure in logs - breach notification requirement, compliance violation',
-            'unencrypted-pii-storage': 'Article 32 violation - data security inadequacy, audit failure risk',
-            'missing-consent-check': 'Article 6 violation - unlawful processing, subject access request complications',
-            'missing-audit-log': 'Article 30 violation - inability to demonstrate compliance during audit'
-        }
-        return impact_map.get(rule_id.split('.')[-1], 'Potential compliance and security risk')
-
-    def _get_remediation_advice(self, rule_id):
-        """Provide specific remediation steps"""
-        remediation_map = {
-            'hardcoded-personal-data': 'Remove hardcoded PII, use environment variables or secure configuration',
-            'detect-pii-in-logs': 'Implement PII filtering in logging, use structured logging with field redaction',
-            'unencrypted-pii-storage': 'Implement field-level encryption for sensitive data in database',
-            'missing-consent-check': 'Add consent validation before data processing operations',
-            'missing-audit-log': 'Implement comprehensive audit logging for all data operations'
-        }
-        return remediation_map.get(rule_id.split('.')[-1], 'Review security best practices and implement appropriate controls')
-
-    def generate_recommendations(self):
-        """Generate executive recommendations based on findings"""
-        if not self.report_data['security_issues']:
-            self.report_data['recommendations'] = [
-                'Continue current security practices',
-                'Consider implementing additional monitoring for runtime security',
-                'Schedule quarterly security reviews to maintain compliance posture'
-            ]
-        else:
-            high_severity_count = len([i for i in self.report_data['security_issues'] if i['severity'] in ['HIGH', 'CRITICAL']])
-
-            if high_severity_count > 0:
-                self.report_data['recommendations'].extend([
-                    f'IMMEDIATE ACTION: Address {high_severity_count} high/critical severity issues',
-                    'Implement mandatory security training for development team',
-                    'Review and strengthen code review processes'
-                ])
-
-            if any('GDPR' in issue['business_impact'] for issue in self.report_data['security_issues']):
-                self.report_data['recommendations'].extend([
-                    'Schedule legal review of data processing practices',
-                    'Conduct GDPR compliance training for technical teams',
-                    'Implement Data Protection Impact Assessment (DPIA) process'
-                ])
-
-    def generate_html_report(self):
-        """Generate executive-friendly HTML report"""
-        html_template = """
-<!DOCTYPE html>
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import ijson
+import orjson
+import jinja2
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+_HIGH_SEVERITIES: frozenset[str] = frozenset({'HIGH', 'CRITICAL'})
+# Scan files at least this large are memory-mapped rather than read into a copy
+_MMAP_THRESHOLD = 64 * 1024
+
+_HTML_TEMPLATE_SRC = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -332,15 +190,15 @@ class SecurityReportGenerator:
         <div class="summary">
             <div class="summary-card">
                 <h3>Overall Risk Level</h3>
-                <div class="value risk-{{ risk_level.lower() }}">{{ risk_level }}</div>
+                <div class="value risk-{{ risk_class }}">{{ risk_level }}</div>
             </div>
             <div class="summary-card">
                 <h3>Compliance Status</h3>
-                <div class="value {{ compliance_status.lower().replace('-', '_') }}">{{ compliance_status }}</div>
+                <div class="value {{ compliance_class }}">{{ compliance_status }}</div>
             </div>
             <div class="summary-card">
                 <h3>Security Issues</h3>
-                <div class="value">{{ security_issues|length }}</div>
+                <div class="value">{{ issue_count }}</div>
             </div>
             <div class="summary-card">
                 <h3>Files Scanned</h3>
@@ -358,7 +216,7 @@ class SecurityReportGenerator:
                     <strong>EXCELLENT:</strong> No security violations detected. The codebase demonstrates strong adherence to GDPR requirements and security best practices.
                 </div>
                 {% else %}
-                <p><strong>Risk Assessment:</strong> {{ security_issues|length }} security issue(s) detected requiring attention. Immediate remediation recommended for high-severity findings to maintain compliance posture.</p>
+                <p><strong>Risk Assessment:</strong> {{ issue_count }} security issue(s) detected requiring attention. Immediate remediation recommended for high-severity findings to maintain compliance posture.</p>
                 {% endif %}
             </div>
 
@@ -369,8 +227,8 @@ class SecurityReportGenerator:
                 <div class="issue">
                     <h4>
                         {{ issue.message }}
-                        <span class="severity {{ issue.severity.lower() }}">{{ issue.severity }}</span>
-                        {% if 'GDPR' in issue.business_impact %}
+                        <span class="severity {{ issue.severity_class }}">{{ issue.severity }}</span>
+                        {% if issue.is_gdpr %}
                         <span class="gdpr-badge">GDPR</span>
                         {% endif %}
                     </h4>
@@ -411,21 +269,322 @@ class SecurityReportGenerator:
     </div>
 </body>
 </html>
-        """
+"""
 
-        template = Template(html_template)
-        return template.render(**self.report_data)
+# Persist compiled template bytecode across runs so cold starts skip codegen
+_JINJA_CACHE_DIR = 'security-reports/.jinja-cache'
+_TEMPLATE_OPTIONS = {
+    # Scan messages and file paths come from the scanned code, so escape them
+    'autoescape': True,
+    'auto_reload': False,
+    'cache_size': -1,
+    'trim_blocks': True,
+    'lstrip_blocks': True
+}
+# Jinja keys bytecode on template name and source only, so fold the options and
+# Jinja release into the file name to stop bytecode compiled under other
+# settings (e.g. without autoescape) being reused
+_TEMPLATE_OPTIONS_KEY = hashlib.sha256(
+    repr((jinja2.__version__, sorted(_TEMPLATE_OPTIONS.items()))).encode()
+).hexdigest()[:16]
+
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that skips writes it cannot make instead of failing the report"""
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+_TEMPLATE_ENV = Environment(
+    loader=DictLoader({'report.html': _HTML_TEMPLATE_SRC}),
+    bytecode_cache=_BestEffortBytecodeCache(
+        directory=_JINJA_CACHE_DIR,
+        pattern=f'%s-{_TEMPLATE_OPTIONS_KEY}.cache'
+    ),
+    **_TEMPLATE_OPTIONS
+)
+
+def _load_json(filepath):
+    """Decode a JSON scan file, parsing large files straight from the page cache"""
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def _new_scan_results():
+    """Empty per-scan results, merged into the report once parsing completes"""
+    return {
+        'security_issues': [],
+        'report_data': {},
+        'high_severity_count': 0,
+        'has_gdpr_issue': False
+    }
+
+class SecurityReportGenerator:
+    # Compiled on first render and shared by every generator instance
+    _TEMPLATE = None
+
+    def __init__(self):
+        self.report_data = {
+            'scan_date': None,
+            'project_name': 'GDPR-Compliant DevSecOps Pipeline',
+            'compliance_framework': 'UK GDPR + DevSecOps Best Practices',
+            'total_files_scanned': 0,
+            'security_issues': [],
+            'compliance_status': 'COMPLIANT',
+            'risk_level': 'LOW',
+            'recommendations': []
+        }
+        # Tracked during ingestion so recommendations need no extra passes
+        self._has_gdpr_issue = False
+        self._high_severity_count = 0
+
+    def load_semgrep_results(self, filepath):
+        """Parse Semgrep PII detection results"""
+        self._merge_scan_results(self._parse_semgrep_results(filepath))
+
+    def load_gitleaks_results(self, filepath):
+        """Parse GitLeaks secret detection results"""
+        self._merge_scan_results(self._parse_gitleaks_results(filepath))
+
+    def load_vulnerability_scan(self, filepath):
+        """Parse vulnerability scan results"""
+        self._merge_scan_results(self._parse_vulnerability_scan(filepath))
+
+    def load_scan_results(self, semgrep_path, gitleaks_path, vulnerability_path):
+        """Parse all scan results concurrently and merge them in scan order"""
+        parsers = (
+            (self._parse_semgrep_results, semgrep_path),
+            (self._parse_gitleaks_results, gitleaks_path),
+            (self._parse_vulnerability_scan, vulnerability_path)
+        )
+        with ThreadPoolExecutor(max_workers=len(parsers)) as pool:
+            futures = [pool.submit(parse, filepath) for parse, filepath in parsers]
+
+        # Merge sequentially so later scans override the risk level as before
+        for future in futures:
+            self._merge_scan_results(future.result())
+
+    def _merge_scan_results(self, scan_results):
+        """Fold one parsed scan into the report"""
+        self.report_data['security_issues'].extend(scan_results['security_issues'])
+        self.report_data.update(scan_results['report_data'])
+        self._high_severity_count += scan_results['high_severity_count']
+        self._has_gdpr_issue |= scan_results['has_gdpr_issue']
+
+    @classmethod
+    def _parse_semgrep_results(cls, filepath):
+        """Convert a Semgrep PII detection results file into scan results"""
+        scan_results = _new_scan_results()
+        try:
+            data = _load_json(filepath)
+
+            report_data = scan_results['report_data']
+            report_data['total_files_scanned'] = len(data.get('paths', {}).get('scanned', []))
+
+            results = data.get('results') or []
+            issues = scan_results['security_issues']
+            has_error = False
+            count = 0
+            for result in results:
+                extra = result['extra']
+                severity = extra['severity']
+                has_error |= severity == 'ERROR'
+                count += 1
+                if severity in _HIGH_SEVERITIES:
+                    scan_results['high_severity_count'] += 1
+                business_impact = cls._get_business_impact(result['check_id'])
+                if 'GDPR' in business_impact:
+                    scan_results['has_gdpr_issue'] = True
+                issue = {
+                    'type': 'GDPR Compliance Violation',
+                    'severity': severity,
+                    'message': extra['message'],
+                    'file': result['path'],
+                    'line': result['start']['line'],
+                    'rule_id': result['check_id'],
+                    'business_impact': business_impact,
+                    'remediation': cls._get_remediation_advice(result['check_id'])
+                }
+                issues.append(issue)
+
+            # Determine overall risk level
+            if count == 0:
+                report_data['risk_level'] = 'LOW'
+                report_data['compliance_status'] = 'COMPLIANT'
+            elif has_error:
+                report_data['risk_level'] = 'HIGH'
+                report_data['compliance_status'] = 'NON-COMPLIANT'
+            else:
+                report_data['risk_level'] = 'MEDIUM'
+                report_data['compliance_status'] = 'PARTIALLY COMPLIANT'
+
+        except FileNotFoundError:
+            print(f"Semgrep results file not found: {filepath}")
+        except (json.JSONDecodeError, orjson.JSONDecodeError):
+            print(f"Invalid JSON in Semgrep results: {filepath}")
+
+        return scan_results
+
+    @staticmethod
+    def _parse_gitleaks_results(filepath):
+        """Convert a GitLeaks secret detection results file into scan results"""
+        scan_results = _new_scan_results()
+        try:
+            data = _load_json(filepath)
+
+            new_issues = [
+                {
+                    'type': 'Secret/PII Exposure',
+                    'severity': 'HIGH',
+                    'message': f"Potential {finding.get('Description', 'secret')} detected",
+                    'file': finding.get('File', 'Unknown'),
+                    'line': finding.get('StartLine', 0),
+                    'rule_id': finding.get('RuleID', 'secret-detection'),
+                    'business_impact': 'Data breach risk, ICO fine exposure (up to £20M)',
+                    'remediation': 'Remove secret from code, rotate credentials, implement secrets management'
+                }
+                for finding in data
+            ]
+            if new_issues:
+                scan_results['security_issues'] = new_issues
+                scan_results['high_severity_count'] = len(new_issues)
+                scan_results['report_data']['risk_level'] = 'CRITICAL'
+                scan_results['report_data']['compliance_status'] = 'NON-COMPLIANT'
+
+        except FileNotFoundError:
+            print(f"GitLeaks results file not found: {filepath}")
+        except (json.JSONDecodeError, orjson.JSONDecodeError, KeyError):
+            print(f"Error parsing GitLeaks results: {filepath}")
+
+        return scan_results
+
+    @staticmethod
+    def _parse_vulnerability_scan(filepath):
+        """Convert a vulnerability scan results file into scan results"""
+        scan_results = _new_scan_results()
+        try:
+            # Stream Grype/Syft vulnerability results one match at a time
+            issues = []
+            with open(filepath, 'rb') as f:
+                for match in ijson.items(f, 'matches.item'):
+                    vulnerability = match.get('vulnerability') or {}
+                    severity = vulnerability.get('severity', 'UNKNOWN')
+                    if severity not in _HIGH_SEVERITIES:
+                        continue
+
+                    fix = vulnerability.get('fix') or {}
+                    versions = fix.get('versions')
+                    fix_version = versions[0] if versions else 'latest'
+                    issues.append({
+                        'type': 'Dependency Vulnerability',
+                        'severity': severity,
+                        'message': f"Vulnerable dependency: {(match.get('artifact') or {}).get('name', 'Unknown')}",
+                        'file': 'package.json',
+                        'line': 0,
+                        'rule_id': vulnerability.get('id', 'vuln-scan'),
+                        'business_impact': "Supply chain security risk, potential data exposure",
+                        'remediation': f"Update to version {fix_version}"
+                    })
+
+            # Only high/critical matches are kept
+            scan_results['security_issues'] = issues
+            scan_results['high_severity_count'] = len(issues)
+
+        except FileNotFoundError:
+            print(f"Vulnerability scan results not found: {filepath}")
+        except (ijson.JSONError, KeyError):
+            print(f"Error parsing vulnerability results: {filepath}")
+
+        return scan_results
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_business_impact(rule_id):
+        """Map technical violations to business impact"""
+        impact_map = {
+            'hardcoded-personal-data': 'GDPR Article 5 violation - ICO fine risk up to £20M, reputational damage',
+            'detect-pii-in-logs': 'Data exposure in logs - breach notification requirement, compliance violation',
+            'unencrypted-pii-storage': 'Article 32 violation - data security inadequacy, audit failure risk',
+            'missing-consent-check': 'Article 6 violation - unlawful processing, subject access request complications',
+            'missing-audit-log': 'Article 30 violation - inability to demonstrate compliance during audit'
+        }
+        return impact_map.get(rule_id.rpartition('.')[2], 'Potential compliance and security risk')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_remediation_advice(rule_id):
+        """Provide specific remediation steps"""
+        remediation_map = {
+            'hardcoded-personal-data': 'Remove hardcoded PII, use environment variables or secure configuration',
+            'detect-pii-in-logs': 'Implement PII filtering in logging, use structured logging with field redaction',
+            'unencrypted-pii-storage': 'Implement field-level encryption for sensitive data in database',
+            'missing-consent-check': 'Add consent validation before data processing operations',
+            'missing-audit-log': 'Implement comprehensive audit logging for all data operations'
+        }
+        return remediation_map.get(rule_id.rpartition('.')[2], 'Review security best practices and implement appropriate controls')
+
+    def generate_recommendations(self):
+        """Generate executive recommendations based on findings"""
+        if not self.report_data['security_issues']:
+            self.report_data['recommendations'] = [
+                'Continue current security practices',
+                'Consider implementing additional monitoring for runtime security',
+                'Schedule quarterly security reviews to maintain compliance posture'
+            ]
+            return
+
+        recommendations = self.report_data['recommendations']
+        if self._high_severity_count > 0:
+            recommendations.extend([
+                f'IMMEDIATE ACTION: Address {self._high_severity_count} high/critical severity issues',
+                'Implement mandatory security training for development team',
+                'Review and strengthen code review processes'
+            ])
+
+        if self._has_gdpr_issue:
+            recommendations.extend([
+                'Schedule legal review of data processing practices',
+                'Conduct GDPR compliance training for technical teams',
+                'Implement Data Protection Impact Assessment (DPIA) process'
+            ])
+
+    def _finalize(self):
+        """Precompute display classes so the template only reads values"""
+        # Stamped lazily so callers can supply their own scan date
+        if self.report_data['scan_date'] is None:
+            self.report_data['scan_date'] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S %Z')
+        self.report_data['issue_count'] = len(self.report_data['security_issues'])
+        self.report_data['risk_class'] = self.report_data['risk_level'].lower()
+        self.report_data['compliance_class'] = self.report_data['compliance_status'].lower().replace('-', '_')
+        for issue in self.report_data['security_issues']:
+            issue['severity_class'] = issue['severity'].lower()
+            issue['is_gdpr'] = 'GDPR' in issue['business_impact']
+
+    def generate_html_report(self):
+        """Generate executive-friendly HTML report"""
+        self._finalize()
+        if SecurityReportGenerator._TEMPLATE is None:
+            SecurityReportGenerator._TEMPLATE = _TEMPLATE_ENV.get_template('report.html')
+        return SecurityReportGenerator._TEMPLATE.render(**self.report_data)
 
 def main():
     """Main report generation function"""
     os.makedirs('security-reports', exist_ok=True)
+    os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
 
     generator = SecurityReportGenerator()
 
     # Load scan results
-    generator.load_semgrep_results('security-reports/pii-scan.json')
-    generator.load_gitleaks_results('security-reports/gitleaks-report.json')
-    generator.load_vulnerability_scan('security-reports/vulnerabilities.json')
+    generator.load_scan_results(
+        'security-reports/pii-scan.json',
+        'security-reports/gitleaks-report.json',
+        'security-reports/vulnerabilities.json'
+    )
 
     # Generate recommendations
     generator.generate_recommendations()
@@ -434,8 +593,8 @@ def main():
     html_report = generator.generate_html_report()
 
     # Save report
-    with open('security-reports/executive-report.html', 'w', encoding='utf-8') as f:
-        f.write(html_report)
+    with open('security-reports/executive-report.html', 'wb') as f:
+        f.write(html_report.encode('utf-8'))
 
     print("Executive security report generated: security-reports/executive-report.html")
     print(f"Report summary: {generator.report_data['compliance_status']} - {generator.report_data['risk_level']} risk")